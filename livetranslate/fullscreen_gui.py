@@ -15,10 +15,11 @@ from PySide6.QtWidgets import (
 
 
 class SubtitleMapWindow(QMainWindow):
-    update_subtitles_signal = Signal(str)
+    update_subtitles_signal = Signal(int, str)
 
-    def __init__(self):
+    def __init__(self, tracks: int = 1):
         super().__init__()
+        self.tracks = tracks
         self.init_ui()
 
         self.update_subtitles_signal.connect(self.update_subtitles)
@@ -38,22 +39,14 @@ class SubtitleMapWindow(QMainWindow):
         central_widget.setPalette(palette)
         self.setCentralWidget(central_widget)
 
-        # Layout for the label
+        # Layout for the labels
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setAlignment(Qt.AlignCenter)  # Center alignment
 
-        self.current_subtitle_label = QLabel("Starting text", self)
-        self.current_subtitle_label.setAlignment(Qt.AlignCenter)
-        self.current_subtitle_label.setWordWrap(True)
-        self.current_subtitle_label.setSizePolicy(
-            QSizePolicy.Preferred, QSizePolicy.Expanding
-        )
-
-        # Set font size
+        # Set font size, sharing the screen height between the tracks
         default_font = QApplication.font()
-        default_font.setPixelSize(100)
-        self.current_subtitle_label.setFont(default_font)
+        default_font.setPixelSize(100 // self.tracks)
 
         dark_yellow = QColor(180, 140, 0)  # RGB values for dark yellow
 
@@ -66,22 +59,34 @@ class SubtitleMapWindow(QMainWindow):
             }}
         """
 
-        self.current_subtitle_label.setStyleSheet(label_style)
-        layout.addWidget(self.current_subtitle_label)
+        # Create a label per subtitle track, stacked top to bottom
+        self.subtitle_labels: list[QLabel] = []
+        for _ in range(self.tracks):
+            label = QLabel("Starting text", self)
+            label.setAlignment(Qt.AlignCenter)
+            label.setWordWrap(True)
+            label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+            label.setFont(default_font)
+            label.setStyleSheet(label_style)
+            layout.addWidget(label)
+            self.subtitle_labels.append(label)
 
-    @Slot(str)
-    def update_subtitles(self, current_subtitle: str) -> None:
-        self.current_subtitle_label.setText(current_subtitle)
+    @Slot(int, str)
+    def update_subtitles(self, track: int, current_subtitle: str) -> None:
+        self.subtitle_labels[track].setText(current_subtitle)
 
 
-def start_gui() -> tuple[QApplication, Callable[[str], None]]:
+def start_gui(tracks: int = 1) -> tuple[QApplication, list[Callable[[str], None]]]:
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
     app: QApplication = QApplication(sys.argv)
-    main_window = SubtitleMapWindow()
+    main_window = SubtitleMapWindow(tracks)
     main_window.showFullScreen()
 
-    def update_subtitles_threadsafe(current_subtitle: str) -> None:
-        main_window.update_subtitles_signal.emit(current_subtitle)
+    def track_updater(track: int) -> Callable[[str], None]:
+        def update_subtitles_threadsafe(current_subtitle: str) -> None:
+            main_window.update_subtitles_signal.emit(track, current_subtitle)
+
+        return update_subtitles_threadsafe
 
-    return app, update_subtitles_threadsafe
+    return app, [track_updater(track) for track in range(tracks)]
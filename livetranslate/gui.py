@@ -15,10 +15,11 @@ from PySide6.QtWidgets import (
 
 
 class SubtitleMapWindow(QMainWindow):
-    update_subtitles_signal = Signal(str)
+    update_subtitles_signal = Signal(int, str)
 
-    def __init__(self):
+    def __init__(self, tracks: int = 1):
         super().__init__(flags=Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
+        self.tracks = tracks
         self.init_ui()
 
         self.update_subtitles_signal.connect(self.update_subtitles)
@@ -31,8 +32,9 @@ class SubtitleMapWindow(QMainWindow):
         self.setAttribute(Qt.WA_TranslucentBackground)
 
         screen = QApplication.primaryScreen().geometry()
+        track_height = 50
         window_width = 1200
-        window_height = 50
+        window_height = track_height * self.tracks
 
         x_position = (
             screen.width() - window_width
@@ -52,17 +54,9 @@ class SubtitleMapWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Create labels for previous and current subtitles
-        self.current_subtitle_label = QLabel("Starting text", self)
-
-        # Set the alignment and add to layout
-        self.current_subtitle_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(self.current_subtitle_label)
-
         # Set font size
         default_font = QApplication.font()
         default_font.setPointSize(24)
-        self.current_subtitle_label.setFont(default_font)
 
         dark_yellow = QColor(180, 140, 0)  # RGB values for dark yellow
 
@@ -76,29 +70,37 @@ class SubtitleMapWindow(QMainWindow):
             }}
         """
 
-        self.current_subtitle_label.setStyleSheet(label_style)
-        self.current_subtitle_label.setAlignment(Qt.AlignCenter)
-        self.current_subtitle_label.setSizePolicy(
-            QSizePolicy.Preferred, QSizePolicy.Preferred
-        )
+        # Create a label per subtitle track, stacked top to bottom
+        self.subtitle_labels: list[QLabel] = []
+        for _ in range(self.tracks):
+            label = QLabel("Starting text", self)
+            label.setFont(default_font)
+            label.setStyleSheet(label_style)
+            label.setAlignment(Qt.AlignCenter)
+            label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+            label.setFixedWidth(window_width - 10)
+            label.setFixedHeight(track_height - 10)
+            layout.addWidget(label)
+            self.subtitle_labels.append(label)
 
-        self.current_subtitle_label.setFixedWidth(window_width - 10)
-        self.current_subtitle_label.setFixedHeight(window_height - 10)
         self.setFixedSize(window_width, window_height)
 
-    @Slot(str)
-    def update_subtitles(self, current_subtitle: str) -> None:
-        self.current_subtitle_label.setText(current_subtitle)
+    @Slot(int, str)
+    def update_subtitles(self, track: int, current_subtitle: str) -> None:
+        self.subtitle_labels[track].setText(current_subtitle)
 
 
-def start_gui() -> tuple[QApplication, Callable[[str], None]]:
+def start_gui(tracks: int = 1) -> tuple[QApplication, list[Callable[[str], None]]]:
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
     app: QApplication = QApplication(sys.argv)
-    main_window = SubtitleMapWindow()
+    main_window = SubtitleMapWindow(tracks)
     main_window.show()
 
-    def update_subtitles_threadsafe(current_subtitle: str) -> None:
-        main_window.update_subtitles_signal.emit(current_subtitle)
+    def track_updater(track: int) -> Callable[[str], None]:
+        def update_subtitles_threadsafe(current_subtitle: str) -> None:
+            main_window.update_subtitles_signal.emit(track, current_subtitle)
+
+        return update_subtitles_threadsafe
 
-    return app, update_subtitles_threadsafe
+    return app, [track_updater(track) for track in range(tracks)]
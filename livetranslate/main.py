@@ -5,11 +5,13 @@ import sys
 from asyncio import (
     AbstractEventLoop,
     Queue,
+    Semaphore,
     Task,
     TaskGroup,
     get_running_loop,
     new_event_loop,
     set_event_loop,
+    timeout,
 )
 from collections import Counter, deque
 from collections.abc import AsyncGenerator, Callable
@@ -24,7 +26,8 @@ from websockets.client import WebSocketClientProtocol
 
 from livetranslate.fullscreen_gui import start_gui as start_gui_fullscreen
 from livetranslate.gui import start_gui
-from livetranslate.mic import RATE, MicrophoneStream
+from livetranslate.mic import RATE, FileStream, MicrophoneStream, MultiChannelStream
+from livetranslate.reorder import ReorderBuffer
 from livetranslate.translate import (
     deepl_language,
     translate_text_deepl,
@@ -33,35 +36,104 @@ from livetranslate.translate import (
 # Load environment variables from .env file
 load_dotenv()
 
+# Seconds a final translation may take before its segment is skipped
+TRANSLATION_TIMEOUT: float = 5.0
 
-async def consumer(
-    queue: Queue[tuple[int, str, bool]],
+
+async def translate(
+    transcript: str,
+    source_language: str,
+    target_language: str,
+    context: deque[str],
+) -> str:
+    if source_language == target_language:
+        return transcript
+
+    return await translate_text_deepl(
+        transcript, source_language, target_language, " ".join(context)
+    )
+
+
+async def final_consumer(
+    queue: Queue[tuple[int, int, str]],
     source_language: str,
     target_language: str,
+    context: deque[str],
+    reorder: ReorderBuffer[str],
     update_subtitles: Callable[[str], None],
+    limit: Semaphore,
 ) -> None:
-    context: deque[str] = deque(maxlen=3)
+    """Translates final transcripts concurrently and shows them in order.
 
-    while True:
-        transcript: str = ""
+    `limit` bounds the translations in flight and is shared by all tracks.
+    """
 
-        _, transcript, is_final = await queue.get()
-        if source_language != target_language:
-            translation: str = await translate_text_deepl(
-                transcript, source_language, target_language, " ".join(context)
-            )
-        else:
-            translation = transcript
+    async def translate_final(seq: int, transcript: str, previous: deque[str]) -> None:
+        translation: str = ""
+        timed_out: bool = False
 
-        queue.task_done()
+        try:
+            async with timeout(TRANSLATION_TIMEOUT):
+                translation = await translate(
+                    transcript, source_language, target_language, previous
+                )
+        except TimeoutError:
+            timed_out = True
+        finally:
+            limit.release()
+
+        skipped: int = reorder.skipped
+        late: int = reorder.late
+
+        ready: list[str] = (
+            reorder.skip(seq, "") if timed_out else reorder.push(seq, translation)
+        )
+        for released in ready:
+            if released:
+                update_subtitles(released)
+
+        if reorder.skipped > skipped:
+            print(f"Warning: skipped {reorder.skipped - skipped} slow segment(s).")
+        if reorder.late > late:
+            print(f"Warning: dropped late segment {seq}.")
+
+    async with TaskGroup() as tg:
+        while True:
+            seq, _, transcript = await queue.get()
+
+            await limit.acquire()
+            # Context is taken from the preceding transcripts, so it does not
+            # depend on their translations having finished.
+            tg.create_task(translate_final(seq, transcript, context.copy()))
+            context.append(transcript)
+
+            queue.task_done()
+
+
+async def interim_consumer(
+    queue: Queue[tuple[int, int, str]],
+    source_language: str,
+    target_language: str,
+    context: deque[str],
+    reorder: ReorderBuffer[str],
+    update_subtitles: Callable[[str], None],
+) -> None:
+    while True:
+        seq, _, transcript = await queue.get()
 
-        if not translation:
+        # Only show an interim once every final before it has been shown and
+        # its own final has not been shown yet.
+        if seq != reorder.next_seq:
+            queue.task_done()
             continue
 
-        if is_final:
-            update_subtitles(translation)
-            context.append(transcript)
-        else:
+        translation: str = await translate(
+            transcript, source_language, target_language, context.copy()
+        )
+
+        queue.task_done()
+
+        if translation and seq == reorder.next_seq:
             update_subtitles(translation)
 
 
@@ -71,12 +143,23 @@ async def sender(
     async for mic_data in audio_generator:
         await ws.send(mic_data)
 
+    # Ask Deepgram to flush the last results; receiver drains them until
+    # Deepgram closes the socket.
+    await ws.send(json.dumps({"type": "CloseStream"}))
+
 
 async def receiver(
-    ws: WebSocketClientProtocol, queue: Queue[tuple[int, str, bool]]
+    ws: WebSocketClientProtocol,
+    finals: list[Queue[tuple[int, int, str]]],
+    interims: list[Queue[tuple[int, int, str]]],
 ) -> None:
+    # Sequence number of the next final transcript per channel. Interims carry
+    # the number of the final they will eventually become.
+    seqs: list[int] = [0] * len(finals)
+
     async for msg in ws:
         res = json.loads(msg)
+        channel: int = res.get("channel_index", [0])[0]
 
         transcript: str = (
             res.get("channel", {}).get("alternatives", [{}])[0].get("transcript", "")
@@ -94,21 +177,42 @@ async def receiver(
 
         speaker: int = counter.most_common(1)[0][0]
 
-        if queue.full():
-            _ = await queue.get()
-            queue.task_done()
-        await queue.put((speaker, transcript, bool(res["is_final"])))
+        if res["is_final"]:
+            await finals[channel].put((seqs[channel], speaker, transcript))
+            seqs[channel] += 1
+            continue
+
+        # Only the latest interim is worth translating.
+        if interims[channel].full():
+            _ = await interims[channel].get()
+            interims[channel].task_done()
+        await interims[channel].put((seqs[channel], speaker, transcript))
+
+
+def open_input(loop: AbstractEventLoop, spec: str) -> MicrophoneStream | FileStream:
+    """An input device index opens that device, anything else is a PCM file."""
+    if spec.isdigit():
+        return MicrophoneStream(loop, device=int(spec))
+
+    return FileStream(spec)
 
 
 async def main(
     *,
     source_language: str,
     target_language: str,
-    update_subtitles: Callable[[str], None],
+    update_subtitles: list[Callable[[str], None]],
+    concurrency: int,
+    inputs: list[str],
 ) -> None:
     loop: AbstractEventLoop = get_running_loop()
 
-    queue: Queue[tuple[int, str, bool]] = Queue(maxsize=1)
+    streams: list[MicrophoneStream | FileStream] = (
+        [open_input(loop, spec) for spec in inputs]
+        if inputs
+        else [MicrophoneStream(loop)]
+    )
+    channels: int = len(streams)
 
     params: dict[str, str] = {
         "diarize": "true",
@@ -118,8 +222,12 @@ async def main(
         "language": source_language,
         "encoding": "linear16",
         "sample_rate": str(RATE),
+        "channels": str(channels),
     }
 
+    if channels > 1:
+        params["multichannel"] = "true"
+
     if params["language"].split("-")[0] in ("en"):
         params["model"] = "nova-3"
     elif params["language"].split("-")[0] in (
@@ -191,19 +299,43 @@ async def main(
 
     # Google Translate functionality has been removed
 
-    async with MicrophoneStream(loop) as stream, websockets.connect(
+    async with MultiChannelStream(streams) as stream, websockets.connect(
         deepgram_url, extra_headers={"Authorization": f"Token {key}"}
     ) as ws, TaskGroup() as tg:
-        tg.create_task(
-            consumer(
-                queue,
-                source_language,
-                target_language,
-                update_subtitles,
+        finals: list[Queue[tuple[int, int, str]]] = []
+        interims: list[Queue[tuple[int, int, str]]] = []
+        limit: Semaphore = Semaphore(concurrency)
+
+        # Every channel is its own subtitle track with its own ordering.
+        for channel in range(channels):
+            finals.append(Queue())
+            interims.append(Queue(maxsize=1))
+            context: deque[str] = deque(maxlen=3)
+            reorder: ReorderBuffer[str] = ReorderBuffer(window=2 * concurrency)
+
+            tg.create_task(
+                final_consumer(
+                    finals[channel],
+                    source_language,
+                    target_language,
+                    context,
+                    reorder,
+                    update_subtitles[channel],
+                    limit,
+                )
+            )
+            tg.create_task(
+                interim_consumer(
+                    interims[channel],
+                    source_language,
+                    target_language,
+                    context,
+                    reorder,
+                    update_subtitles[channel],
+                )
             )
-        )
 
-        tg.create_task(receiver(ws, queue))
+        tg.create_task(receiver(ws, finals, interims))
         tg.create_task(sender(ws, stream.generator()))
 
 
@@ -241,16 +373,37 @@ if __name__ == "__main__":
         default=False,
         help="Launch application fullscreen",
     )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        default=4,
+        type=int,
+        help="Maximum number of final transcripts translated at once (default: 4)",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        default=[],
+        type=str,
+        help="Audio input: an input device index or a raw 16-bit mono PCM file. "
+        "Repeat to capture several inputs as separate subtitle tracks "
+        "(default: the default input device)",
+    )
 
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
     app: QApplication
-    update_subtitles: Callable[[str], None]
+    update_subtitles: list[Callable[[str], None]]
+    tracks: int = max(len(args.input), 1)
 
     if args.fullscreen:
-        app, update_subtitles = start_gui_fullscreen()
+        app, update_subtitles = start_gui_fullscreen(tracks)
     else:
-        app, update_subtitles = start_gui()
+        app, update_subtitles = start_gui(tracks)
 
     target: str = args.target
     if not target:
@@ -262,6 +415,8 @@ if __name__ == "__main__":
             source_language=args.source,
             target_language=target,
             update_subtitles=update_subtitles,
+            concurrency=args.concurrency,
+            inputs=args.input,
         )
     )
 
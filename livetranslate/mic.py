@@ -1,6 +1,16 @@
-from asyncio import AbstractEventLoop, Queue, QueueEmpty
+from asyncio import (
+    AbstractEventLoop,
+    Event,
+    Queue,
+    QueueEmpty,
+    Task,
+    create_task,
+    sleep,
+)
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 
+import numpy as np
 import pyaudio
 
 RATE: int = 16_000
@@ -11,11 +21,16 @@ class MicrophoneStream:
     """Opens a recording stream as a generator yielding the audio chunks."""
 
     def __init__(
-        self, loop: AbstractEventLoop, rate: int = RATE, chunk: int = CHUNK
+        self,
+        loop: AbstractEventLoop,
+        rate: int = RATE,
+        chunk: int = CHUNK,
+        device: int | None = None,
     ) -> None:
         """The audio -- and generator -- is guaranteed to be on the main thread."""
         self._rate = rate
         self._chunk = chunk
+        self._device = device
         self.loop: AbstractEventLoop = loop
 
         # Create a thread-safe buffer of audio data
@@ -29,6 +44,7 @@ class MicrophoneStream:
             channels=1,
             rate=self._rate,
             input=True,
+            input_device_index=self._device,
             frames_per_buffer=self._chunk,
             # Run the audio stream asynchronously to fill the buffer object.
             # This is necessary so that the input device's buffer doesn't
@@ -102,3 +118,153 @@ class MicrophoneStream:
                     break
 
             yield b"".join(data)
+
+
+class FileStream:
+    """Replays a raw 16-bit mono PCM file in real time, in place of a microphone."""
+
+    def __init__(self, path: str, rate: int = RATE, chunk: int = CHUNK) -> None:
+        self._path = path
+        self._rate = rate
+        self._chunk = chunk
+        self.closed = True
+
+    async def __aenter__(self) -> "FileStream":
+        self._file = open(self._path, "rb")  # noqa: SIM115
+        self.closed = False
+
+        return self
+
+    async def __aexit__(
+        self,
+        *_,
+    ) -> None:
+        self.closed = True
+        self._file.close()
+
+    async def generator(self) -> AsyncGenerator[bytes, None]:
+        """Generates audio chunks at the pace they would be recorded.
+
+        Args:
+            self: The FileStream object
+
+        Returns:
+            A generator that outputs audio chunks until the file is exhausted.
+        """
+        while not self.closed:
+            chunk = self._file.read(self._chunk * 2)
+            if not chunk:
+                return
+
+            yield chunk
+            await sleep(self._chunk / self._rate)
+
+
+class MultiChannelStream:
+    """Interleaves several mono streams into a single multichannel stream."""
+
+    def __init__(
+        self, streams: list[MicrophoneStream | FileStream], max_lag: int = 3 * CHUNK
+    ) -> None:
+        """Channel `i` of the output is `streams[i]`.
+
+        An input falling behind the others by more than `max_lag` frames, e.g.
+        because it stalled or its clock is slightly slower, is padded with
+        silence so the other channels keep streaming.
+        """
+        self._streams = streams
+        self._max_lag = max_lag
+        self.channels: int = len(streams)
+
+    async def __aenter__(self) -> "MultiChannelStream":
+        async with AsyncExitStack() as stack:
+            for stream in self._streams:
+                await stack.enter_async_context(stream)
+            # Only keep the inputs open once all of them have opened.
+            self._stack = stack.pop_all()
+
+        return self
+
+    async def __aexit__(
+        self,
+        *_,
+    ) -> None:
+        await self._stack.aclose()
+
+    async def generator(self) -> AsyncGenerator[bytes, None]:
+        """Generates interleaved 16-bit frames covering all the inputs.
+
+        Inputs open and deliver audio independently, so each is buffered until
+        every input has data for the same frames. Audio recorded before the
+        last input delivered its first chunk is discarded so that all channels
+        start together. The stream ends as soon as any input ends, and raises
+        if any input fails.
+
+        Args:
+            self: The MultiChannelStream object
+
+        Returns:
+            A generator that outputs interleaved audio chunks.
+        """
+        buffers: list[bytearray] = [bytearray() for _ in self._streams]
+        started: list[bool] = [False] * len(self._streams)
+        arrived: Event = Event()
+        ended: Event = Event()
+        max_lag: int = self._max_lag * 2
+
+        async def pump(i: int, stream: MicrophoneStream | FileStream) -> None:
+            try:
+                async for data in stream.generator():
+                    buffers[i] += data
+
+                    if not started[i]:
+                        started[i] = True
+                        if all(started):
+                            # Keep only the audio covering the same span as this
+                            # first chunk, the rest predates the slowest input.
+                            # Whole samples only, so channels stay int16 aligned.
+                            for buffer in buffers:
+                                excess = max(len(buffer) - len(data), 0)
+                                del buffer[: excess // 2 * 2]
+
+                    arrived.set()
+            finally:
+                ended.set()
+                arrived.set()
+
+        pumps: list[Task[None]] = [
+            create_task(pump(i, stream)) for i, stream in enumerate(self._streams)
+        ]
+
+        try:
+            while True:
+                await arrived.wait()
+                arrived.clear()
+
+                for task in pumps:
+                    if task.done() and (error := task.exception()) is not None:
+                        raise error
+
+                # Bound how far any input may fall behind the others.
+                longest: int = max(len(buffer) for buffer in buffers)
+                for buffer in buffers:
+                    missing: int = (longest - max_lag - len(buffer)) // 2 * 2
+                    if missing > 0:
+                        buffer += bytes(missing)
+
+                size: int = min(len(buffer) for buffer in buffers) // 2 * 2
+                if size:
+                    frames: list[np.ndarray] = [
+                        np.frombuffer(buffer[:size], dtype=np.int16)
+                        for buffer in buffers
+                    ]
+                    for buffer in buffers:
+                        del buffer[:size]
+
+                    yield np.column_stack(frames).tobytes()
+
+                if ended.is_set():
+                    return
+        finally:
+            for task in pumps:
+                task.cancel()
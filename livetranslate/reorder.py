@@ -0,0 +1,67 @@
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ReorderBuffer(Generic[T]):
+    """Releases results completed out of order strictly in sequence order."""
+
+    def __init__(self, window: int) -> None:
+        """Holds at most `window` results back while waiting for a missing one.
+
+        Once more results than that are waiting, the missing sequence number is
+        given up on (skipped) so a single slow request cannot stall the output.
+        """
+        self._window = window
+        self._pending: dict[int, T] = {}
+        self.next_seq: int = 0
+        self.skipped: int = 0
+        self.late: int = 0
+
+    def push(self, seq: int, item: T) -> list[T]:
+        """Adds a completed result and returns everything that is now in order.
+
+        Args:
+            seq: The sequence number the result was dispatched with
+            item: The result itself
+
+        Returns:
+            The results that can be released, in sequence order. A result whose
+            sequence number has already been skipped is dropped and counted as
+            late.
+        """
+        if seq < self.next_seq:
+            self.late += 1
+            return []
+
+        self._pending[seq] = item
+        released: list[T] = []
+
+        while True:
+            while self.next_seq in self._pending:
+                released.append(self._pending.pop(self.next_seq))
+                self.next_seq += 1
+
+            if len(self._pending) <= self._window:
+                return released
+
+            # Too much is waiting behind the missing result, give up on it.
+            self.skipped += 1
+            self.next_seq += 1
+
+    def skip(self, seq: int, placeholder: T) -> list[T]:
+        """Gives up on a result that will never complete, e.g. one that timed out.
+
+        Args:
+            seq: The sequence number the result was dispatched with
+            placeholder: Released in place of the missing result
+
+        Returns:
+            The results that can be released, in sequence order.
+        """
+        if seq < self.next_seq:
+            # Already given up on by the window.
+            return []
+
+        self.skipped += 1
+        return self.push(seq, placeholder)